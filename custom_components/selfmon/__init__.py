@@ -1,11 +1,14 @@
 """The SelfMon (Honeywell Galaxy Alarm) integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any, Callable, Iterable
 
+from homeassistant.components import mqtt
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from .const import (
     CONF_MODULE_PATH,
@@ -18,6 +21,82 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
+# Per-entry shared MQTT subscriptions, keyed by (topic, encoding)
+DATA_SUBSCRIPTIONS = "subscriptions"
+
+
+async def _async_get_subscription(
+    hass: HomeAssistant,
+    entry_data: dict[str, Any],
+    topic: str,
+    qos: int = 0,
+    encoding: str | None = "utf-8",
+) -> tuple[Callable[[], None], list[Callable[[Any], None]]]:
+    """Return the shared subscription record for a topic, creating it if needed."""
+    subscriptions = entry_data.setdefault(DATA_SUBSCRIPTIONS, {})
+    key = (topic, encoding)
+    record = subscriptions.get(key)
+    if record is None:
+        callbacks: list[Callable[[Any], None]] = []
+
+        @callback
+        def dispatch(msg) -> None:
+            for topic_callback in callbacks:
+                topic_callback(msg)
+
+        unsubscribe = await mqtt.async_subscribe(
+            hass, topic, dispatch, qos=qos, encoding=encoding
+        )
+        record = subscriptions[key] = (unsubscribe, callbacks)
+
+    return record
+
+
+async def async_prime_subscriptions(
+    hass: HomeAssistant,
+    entry_data: dict[str, Any],
+    topics: Iterable[tuple[str, str | None]],
+    qos: int = 0,
+) -> None:
+    """Open the shared subscriptions for several (topic, encoding) pairs.
+
+    Called before entities are added so their async_added_to_hass finds the
+    subscriptions already open instead of awaiting the broker one by one.
+    """
+    await asyncio.gather(
+        *(
+            _async_get_subscription(hass, entry_data, topic, qos, encoding)
+            for topic, encoding in set(topics)
+        )
+    )
+
+
+async def async_subscribe_shared(
+    hass: HomeAssistant,
+    entry_data: dict[str, Any],
+    topic: str,
+    msg_callback: Callable[[Any], None],
+    qos: int = 0,
+    encoding: str | None = "utf-8",
+) -> Callable[[], None]:
+    """Attach a callback to a broker subscription shared per topic.
+
+    Entities on the same topic and encoding share one mqtt.async_subscribe;
+    the broker subscription is dropped once the last callback detaches.
+    """
+    subscriptions = entry_data.setdefault(DATA_SUBSCRIPTIONS, {})
+    record = await _async_get_subscription(hass, entry_data, topic, qos, encoding)
+    record[1].append(msg_callback)
+
+    @callback
+    def remove() -> None:
+        record[1].remove(msg_callback)
+        if not record[1]:
+            record[0]()
+            subscriptions.pop((topic, encoding), None)
+
+    return remove
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SelfMon (Honeywell Galaxy Alarm) from a config entry."""
@@ -40,7 +119,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Drop any shared subscriptions no entity detached (e.g. primed
+        # topics whose entities never attached)
+        for unsubscribe, _ in data.get(DATA_SUBSCRIPTIONS, {}).values():
+            unsubscribe()
 
     return unload_ok
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components import mqtt
@@ -31,7 +32,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-DEVICE_CLASS_MAP = {
+# Read-only lookup tables; MappingProxyType guards against mutation
+DEVICE_CLASS_MAP = MappingProxyType({
     "door": BinarySensorDeviceClass.DOOR,
     "motion": BinarySensorDeviceClass.MOTION,
     "smoke": BinarySensorDeviceClass.SMOKE,
@@ -41,7 +43,14 @@ DEVICE_CLASS_MAP = {
     "vibration": BinarySensorDeviceClass.VIBRATION,
     "tamper": BinarySensorDeviceClass.TAMPER,
     "problem": BinarySensorDeviceClass.PROBLEM,
-}
+    # Sentinel so lookups need no "None"-string special case
+    "None": None,
+})
+
+_PAYLOAD_MAP = MappingProxyType({
+    PAYLOAD_OPEN: True,
+    PAYLOAD_CLOSED: False,
+})
 
 
 async def async_setup_entry(
@@ -54,23 +63,27 @@ async def async_setup_entry(
     module_path = data[CONF_MODULE_PATH]
     sensors_config = data.get(CONF_SENSORS, {})
 
-    entities = []
-
-    for sensor_key, sensor_data in sensors_config.items():
-        if not sensor_data.get(CONF_SENSOR_ENABLED, True):
-            continue
-
-        sensor_type = sensor_data.get(CONF_SENSOR_TYPE)
-
-        if sensor_type == SENSOR_TYPE_ZONE_INPUT:
-            entities.append(
-                SelfMonZoneSensor(
-                    module_path=module_path,
-                    sensor_key=sensor_key,
-                    sensor_config=sensor_data,
-                    entry_id=config_entry.entry_id,
-                )
-            )
+    # One DeviceInfo per module, shared by every entity on it
+    module_id = module_path.rpartition(".")[2] or module_path
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, f"selfmon_{module_id}")},
+        name="Honeywell Galaxy Alarm",
+        manufacturer=MANUFACTURER,
+        model=f"VMOD {module_id}",
+    )
+
+    entities = [
+        SelfMonZoneSensor(
+            module_path=module_path,
+            sensor_key=sensor_key,
+            sensor_config=sensor_data,
+            entry_id=config_entry.entry_id,
+            device_info=device_info,
+        )
+        for sensor_key, sensor_data in sensors_config.items()
+        if sensor_data.get(CONF_SENSOR_ENABLED, True)
+        and sensor_data.get(CONF_SENSOR_TYPE) == SENSOR_TYPE_ZONE_INPUT
+    ]
 
     async_add_entities(entities)
 
@@ -78,6 +91,17 @@ async def async_setup_entry(
 class SelfMonZoneSensor(BinarySensorEntity):
     """Representation of a SelfMon zone sensor."""
 
+    __slots__ = (
+        "_module_path",
+        "_sensor_key",
+        "_sensor_config",
+        "_entry_id",
+        "_zone_id",
+        "_topic",
+        "_module_id",
+        "_unsubscribe",
+    )
+
     _attr_has_entity_name = True
     _attr_should_poll = False
 
@@ -87,6 +111,7 @@ class SelfMonZoneSensor(BinarySensorEntity):
         sensor_key: str,
         sensor_config: dict[str, Any],
         entry_id: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the zone sensor."""
         self._module_path = module_path
@@ -97,44 +122,39 @@ class SelfMonZoneSensor(BinarySensorEntity):
         self._zone_id = sensor_config.get(CONF_SENSOR_ZONE_ID, "")
         self._topic = sensor_config.get("topic", sensor_key)
 
-        module_id = module_path.split(".")[-1] if "." in module_path else module_path
+        module_id = module_path.rpartition(".")[2] or module_path
+        self._module_id = module_id
         self._attr_unique_id = f"selfmon_{module_id}_zone_{self._zone_id}"
 
         self._attr_name = sensor_config.get(CONF_SENSOR_NAME, f"Zone {self._zone_id}")
 
-        device_class_str = sensor_config.get(CONF_SENSOR_DEVICE_CLASS, "None")
-        if device_class_str and device_class_str != "None":
-            self._attr_device_class = DEVICE_CLASS_MAP.get(device_class_str)
+        self._attr_device_class = DEVICE_CLASS_MAP.get(
+            sensor_config.get(CONF_SENSOR_DEVICE_CLASS, "None")
+        )
 
-        self._attr_is_on = None
+        self._attr_device_info = device_info
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        module_id = self._module_path.split(".")[-1] if "." in self._module_path else self._module_path
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"selfmon_{module_id}")},
-            name="Honeywell Galaxy Alarm",
-            manufacturer=MANUFACTURER,
-            model=f"VMOD {module_id}",
-        )
+        self._attr_is_on = None
+        self._unsubscribe = None
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to MQTT topic when added to hass."""
+        # Bind hot names as locals so the per-message callback is
+        # straight-line lookup/assign/call with no attribute lookups
+        payload_map = _PAYLOAD_MAP
+        write_state = self.async_write_ha_state
+
         @callback
         def message_received(msg):
             """Handle new MQTT message."""
-            payload = msg.payload
-            if payload == PAYLOAD_OPEN:
-                self._attr_is_on = True
-            elif payload == PAYLOAD_CLOSED:
-                self._attr_is_on = False
-            else:
+            state = payload_map.get(msg.payload)
+            if state is None:
                 _LOGGER.warning(
-                    "Unexpected payload for %s: %s", self._topic, payload
+                    "Unexpected payload for %s: %s", self._topic, msg.payload
                 )
                 return
-            self.async_write_ha_state()
+            self._attr_is_on = state
+            write_state()
 
         self._unsubscribe = await mqtt.async_subscribe(
             self.hass, self._topic, message_received, qos=0
@@ -142,5 +162,6 @@ class SelfMonZoneSensor(BinarySensorEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Unsubscribe from MQTT topic when removed."""
-        if hasattr(self, "_unsubscribe"):
+        if self._unsubscribe is not None:
             self._unsubscribe()
+            self._unsubscribe = None
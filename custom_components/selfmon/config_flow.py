@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 import re
 from typing import Any
@@ -24,6 +25,7 @@ from .const import (
     CONF_SENSOR_DEVICE_CLASS,
     CONF_SENSOR_ZONE_ID,
     DEVICE_CLASS_OPTIONS,
+    DISCOVERY_QUIESCE_TIMEOUT,
     DISCOVERY_TIMEOUT,
     DOMAIN,
     MODULE_DISCOVERY_TIMEOUT,
@@ -44,20 +46,28 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precompiled once - the discovery callback runs for every retained message
+_MODULE_RE = re.compile(r"(selfmon/vmod\.[a-fA-F0-9]+)")
+_MANUAL_RE = re.compile(r"^selfmon/vmod\.[a-fA-F0-9]+$")
+
+# Default device class by last digit of the zone ID
+_LAST_DIGIT_MAP = {
+    "1": "door",
+    "7": "door",
+    "2": "motion",
+    "8": "motion",
+    "4": "smoke",
+    "6": "smoke",
+    "3": "safety",
+    "5": "safety",
+}
+
 
 def get_default_device_class(zone_id: str, topic: str) -> str:
     """Guess a default device class based on zone ID patterns."""
-    zone_num = int(zone_id) if zone_id.isdigit() else 0
-    last_digit = zone_num % 10
-    if last_digit in (1, 7):
-        return "door"
-    elif last_digit in (2, 8):
-        return "motion"
-    elif last_digit in (4, 6):
-        return "smoke"
-    elif last_digit in (3, 5):
-        return "safety"
-    return "None"
+    if not zone_id or not zone_id.isdigit():
+        return "None"
+    return _LAST_DIGIT_MAP.get(zone_id[-1], "None")
 
 
 def get_default_sensor_name(sensor_type: str, sensor_id: str) -> str:
@@ -77,6 +87,87 @@ def get_default_sensor_name(sensor_type: str, sensor_id: str) -> str:
     return f"Sensor {sensor_id}"
 
 
+def _make_sensor(
+    sensor_type: str,
+    zone_id: str,
+    topic: str,
+    device_class: str = "None",
+    is_prio: bool | None = None,
+    auto_enabled: bool = False,
+) -> dict[str, Any]:
+    """Build a discovered-sensor entry with the shared field shape."""
+    entry = {
+        CONF_SENSOR_TYPE: sensor_type,
+        CONF_SENSOR_ZONE_ID: zone_id,
+        CONF_SENSOR_NAME: get_default_sensor_name(sensor_type, zone_id),
+        CONF_SENSOR_DEVICE_CLASS: device_class,
+        CONF_SENSOR_ENABLED: True,
+        "topic": topic,
+        "auto_enabled": auto_enabled,
+    }
+    if is_prio is not None:
+        entry["is_prio"] = is_prio
+    return entry
+
+
+def _zone_input_entry(relative_topic: str, topic: str, is_prio: bool) -> dict[str, Any]:
+    """Build a discovered zone-input sensor entry."""
+    zone_id = relative_topic.split("/")[-1]
+    return _make_sensor(
+        SENSOR_TYPE_ZONE_INPUT,
+        zone_id,
+        topic,
+        device_class=get_default_device_class(zone_id, topic),
+        is_prio=is_prio,
+    )
+
+
+def _output_entry(relative_topic: str, topic: str, is_prio: bool) -> dict[str, Any]:
+    """Build a discovered output sensor entry."""
+    return _make_sensor(
+        SENSOR_TYPE_OUTPUT, relative_topic.split("/")[-1], topic, is_prio=is_prio
+    )
+
+
+def _temperature_entry(relative_topic: str, topic: str) -> dict[str, Any]:
+    """Build a discovered temperature sensor entry."""
+    return _make_sensor(
+        SENSOR_TYPE_TEMPERATURE,
+        "temperature",
+        topic,
+        device_class="temperature",
+        auto_enabled=True,
+    )
+
+
+def _vkp_line_entry(relative_topic: str, topic: str) -> dict[str, Any]:
+    """Build a discovered keypad display line sensor entry."""
+    line_id = "line1" if "line1" in relative_topic else "line2"
+    return _make_sensor(SENSOR_TYPE_VKP_LINE, line_id, topic, auto_enabled=True)
+
+
+def _version_entry(relative_topic: str, topic: str) -> dict[str, Any]:
+    """Build a discovered version sensor entry."""
+    return _make_sensor(SENSOR_TYPE_VERSION, "version", topic, auto_enabled=True)
+
+
+# Exact-topic dispatch first, then the wildcard prefixes (zone inputs are
+# by far the most common, so they lead the prefix scan)
+_EXACT_DISPATCH = {
+    TOPIC_TEMPERATURE: _temperature_entry,
+    TOPIC_VKP_LINE1: _vkp_line_entry,
+    TOPIC_VKP_LINE2: _vkp_line_entry,
+    TOPIC_VERSION: _version_entry,
+}
+
+_PREFIX_DISPATCH = (
+    (TOPIC_PRIO_INPUTS, _zone_input_entry, True),
+    (TOPIC_VRIO_INPUTS, _zone_input_entry, False),
+    (TOPIC_PRIO_OUTPUTS, _output_entry, True),
+    (TOPIC_VRIO_OUTPUTS, _output_entry, False),
+)
+
+
 class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for SelfMon (Honeywell Galaxy Alarm)."""
 
@@ -89,6 +180,7 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_sensors: dict[str, dict[str, Any]] = {}
         self._current_sensor_index: int = 0
         self._sensor_keys: list[str] = []
+        self._total: int = 0
         self._enable_outputs: bool = False
 
     async def async_step_user(
@@ -100,14 +192,21 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         self._discovered_modules = set()
 
+        loop = self.hass.loop
+        last_seen: float | None = None
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
         @callback
         def module_discovered(msg):
             """Handle discovered module topics."""
+            nonlocal last_seen
+            last_seen = loop.time()
             topic = msg.topic
-            match = re.match(r"(selfmon/vmod\.[a-fA-F0-9]+)", topic)
+            match = _MODULE_RE.match(topic)
             if match:
                 self._discovered_modules.add(match.group(1))
-                _LOGGER.debug("Discovered module: %s from topic: %s", match.group(1), topic)
+                if debug:
+                    _LOGGER.debug("Discovered module: %s from topic: %s", match.group(1), topic)
 
         # Subscribe to multiple patterns to increase chance of discovery
         # Some topics may have retained messages
@@ -118,21 +217,30 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             "selfmon/vmod.+/vkp/display/#",
             "selfmon/vmod.+/prio/#",
             "selfmon/vmod.+/vrio/#",
-            "selfmon/#",
         ]
         
+        # Register all patterns in one batch rather than one round trip each
+        results = await asyncio.gather(
+            *(
+                mqtt.async_subscribe(self.hass, pattern, module_discovered, qos=0)
+                for pattern in subscribe_patterns
+            ),
+            return_exceptions=True,
+        )
         unsubscribes = []
-        for pattern in subscribe_patterns:
-            try:
-                unsub = await mqtt.async_subscribe(
-                    self.hass, pattern, module_discovered, qos=0
-                )
-                unsubscribes.append(unsub)
-            except Exception as ex:
-                _LOGGER.debug("Failed to subscribe to %s: %s", pattern, ex)
+        for pattern, result in zip(subscribe_patterns, results):
+            if isinstance(result, Exception):
+                _LOGGER.debug("Failed to subscribe to %s: %s", pattern, result)
+            else:
+                unsubscribes.append(result)
+
+        # Wait for retained messages, ending early once the stream goes quiet
+        start = loop.time()
+        while loop.time() - start < MODULE_DISCOVERY_TIMEOUT:
+            await asyncio.sleep(0.1)
+            if last_seen is not None and loop.time() - last_seen >= DISCOVERY_QUIESCE_TIMEOUT:
+                break
 
-        await asyncio.sleep(MODULE_DISCOVERY_TIMEOUT)
-        
         for unsub in unsubscribes:
             unsub()
 
@@ -191,7 +299,7 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             module_path = user_input[CONF_MODULE_PATH].strip().rstrip("/")
 
-            if not re.match(r"^selfmon/vmod\.[a-fA-F0-9]+$", module_path):
+            if not _MANUAL_RE.match(module_path):
                 errors["base"] = "invalid_path"
             else:
                 await self.async_set_unique_id(module_path)
@@ -249,84 +357,74 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         unsubscribes = []
 
+        loop = self.hass.loop
+        last_seen: float | None = None
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        # Hoisted out of the callback; rebuilt f-strings are per-message cost
+        module_prefix = f"{self._module_path}/"
+        prefix_len = len(module_prefix)
+
         @callback
         def message_received(msg):
             """Handle received MQTT message for discovery."""
+            nonlocal last_seen
+            last_seen = loop.time()
             topic = msg.topic
-            _LOGGER.debug("Discovered topic: %s", topic)
-
-            relative_topic = topic.replace(f"{self._module_path}/", "", 1)
-            sensor_key = topic
-
-            if relative_topic.startswith(TOPIC_PRIO_INPUTS) or relative_topic.startswith(TOPIC_VRIO_INPUTS):
-                zone_id = relative_topic.split("/")[-1]
-                sensor_type = SENSOR_TYPE_ZONE_INPUT
-                device_class = get_default_device_class(zone_id, topic)
-                self._discovered_sensors[sensor_key] = {
-                    CONF_SENSOR_TYPE: sensor_type,
-                    CONF_SENSOR_ZONE_ID: zone_id,
-                    CONF_SENSOR_NAME: get_default_sensor_name(sensor_type, zone_id),
-                    CONF_SENSOR_DEVICE_CLASS: device_class,
-                    CONF_SENSOR_ENABLED: True,
-                    "topic": topic,
-                    "is_prio": TOPIC_PRIO_INPUTS in relative_topic,
-                    "auto_enabled": False,
-                }
-            elif relative_topic.startswith(TOPIC_PRIO_OUTPUTS) or relative_topic.startswith(TOPIC_VRIO_OUTPUTS):
-                output_id = relative_topic.split("/")[-1]
-                sensor_type = SENSOR_TYPE_OUTPUT
-                self._discovered_sensors[sensor_key] = {
-                    CONF_SENSOR_TYPE: sensor_type,
-                    CONF_SENSOR_ZONE_ID: output_id,
-                    CONF_SENSOR_NAME: get_default_sensor_name(sensor_type, output_id),
-                    CONF_SENSOR_DEVICE_CLASS: "None",
-                    CONF_SENSOR_ENABLED: True,
-                    "topic": topic,
-                    "is_prio": TOPIC_PRIO_OUTPUTS in relative_topic,
-                    "auto_enabled": False,
-                }
-            elif relative_topic == TOPIC_TEMPERATURE:
-                self._discovered_sensors[sensor_key] = {
-                    CONF_SENSOR_TYPE: SENSOR_TYPE_TEMPERATURE,
-                    CONF_SENSOR_ZONE_ID: "temperature",
-                    CONF_SENSOR_NAME: get_default_sensor_name(SENSOR_TYPE_TEMPERATURE, ""),
-                    CONF_SENSOR_DEVICE_CLASS: "temperature",
-                    CONF_SENSOR_ENABLED: True,
-                    "topic": topic,
-                    "auto_enabled": True,
-                }
-            elif relative_topic in (TOPIC_VKP_LINE1, TOPIC_VKP_LINE2):
-                line_id = "line1" if "line1" in relative_topic else "line2"
-                self._discovered_sensors[sensor_key] = {
-                    CONF_SENSOR_TYPE: SENSOR_TYPE_VKP_LINE,
-                    CONF_SENSOR_ZONE_ID: line_id,
-                    CONF_SENSOR_NAME: get_default_sensor_name(SENSOR_TYPE_VKP_LINE, line_id),
-                    CONF_SENSOR_DEVICE_CLASS: "None",
-                    CONF_SENSOR_ENABLED: True,
-                    "topic": topic,
-                    "auto_enabled": True,
-                }
-            elif relative_topic == TOPIC_VERSION:
-                self._discovered_sensors[sensor_key] = {
-                    CONF_SENSOR_TYPE: SENSOR_TYPE_VERSION,
-                    CONF_SENSOR_ZONE_ID: "version",
-                    CONF_SENSOR_NAME: get_default_sensor_name(SENSOR_TYPE_VERSION, ""),
-                    CONF_SENSOR_DEVICE_CLASS: "None",
-                    CONF_SENSOR_ENABLED: True,
-                    "topic": topic,
-                    "auto_enabled": True,
-                }
-
-        for topic_pattern in topics_to_subscribe:
-            try:
-                unsub = await mqtt.async_subscribe(
-                    self.hass, topic_pattern, message_received, qos=0
+            if debug:
+                _LOGGER.debug("Discovered topic: %s", topic)
+
+            if topic.startswith(module_prefix):
+                relative_topic = topic[prefix_len:]
+            else:
+                relative_topic = topic
+
+            builder = _EXACT_DISPATCH.get(relative_topic)
+            if builder is not None:
+                entry = builder(relative_topic, topic)
+            else:
+                for topic_prefix, prefix_builder, is_prio in _PREFIX_DISPATCH:
+                    if relative_topic.startswith(topic_prefix):
+                        entry = prefix_builder(relative_topic, topic, is_prio)
+                        break
+                else:
+                    return
+
+            # Compact key keeps entry.data small; the full topic lives in
+            # the entry itself (entities fall back to the key for legacy
+            # configs that were stored keyed by topic). prio and vrio
+            # sensors can carry the same id, so those keys also encode
+            # which bus the sensor lives on.
+            is_prio = entry.get("is_prio")
+            if is_prio is None:
+                sensor_key = f"{entry[CONF_SENSOR_TYPE]}:{entry[CONF_SENSOR_ZONE_ID]}"
+            else:
+                sensor_key = (
+                    f"{entry[CONF_SENSOR_TYPE]}:"
+                    f"{'p' if is_prio else 'v'}{entry[CONF_SENSOR_ZONE_ID]}"
                 )
-                unsubscribes.append(unsub)
-            except Exception as ex:
-                _LOGGER.error("Failed to subscribe to %s: %s", topic_pattern, ex)
+            self._discovered_sensors[sensor_key] = entry
+
+        # Register all topics in one batch rather than one round trip each
+        results = await asyncio.gather(
+            *(
+                mqtt.async_subscribe(self.hass, topic_pattern, message_received, qos=0)
+                for topic_pattern in topics_to_subscribe
+            ),
+            return_exceptions=True,
+        )
+        for topic_pattern, result in zip(topics_to_subscribe, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to subscribe to %s: %s", topic_pattern, result)
+            else:
+                unsubscribes.append(result)
 
-        await asyncio.sleep(DISCOVERY_TIMEOUT)
+        # Wait for retained messages, ending early once the stream goes quiet
+        start = loop.time()
+        while loop.time() - start < DISCOVERY_TIMEOUT:
+            await asyncio.sleep(0.1)
+            if last_seen is not None and loop.time() - last_seen >= DISCOVERY_QUIESCE_TIMEOUT:
+                break
 
         for unsub in unsubscribes:
             unsub()
@@ -344,6 +442,7 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             key for key, data in sorted(self._discovered_sensors.items())
             if not data.get("auto_enabled", False)
         ]
+        self._total = len(self._sensor_keys)
         self._current_sensor_index = 0
 
         if not self._sensor_keys:
@@ -371,17 +470,7 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             self._current_sensor_index += 1
 
-            if self._current_sensor_index >= len(self._sensor_keys):
-                return self.async_create_entry(
-                    title="Honeywell Galaxy Alarm",
-                    data={
-                        CONF_MODULE_PATH: self._module_path,
-                        CONF_SENSORS: self._discovered_sensors,
-                        CONF_ENABLE_OUTPUTS: self._enable_outputs,
-                    },
-                )
-
-        if self._current_sensor_index >= len(self._sensor_keys):
+        if self._current_sensor_index >= self._total:
             return self.async_create_entry(
                 title="Honeywell Galaxy Alarm",
                 data={
@@ -391,15 +480,12 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-        current_key = self._sensor_keys[self._current_sensor_index]
+        index = self._current_sensor_index
+        current_key = self._sensor_keys[index]
         sensor_data = self._discovered_sensors[current_key]
         sensor_type = sensor_data[CONF_SENSOR_TYPE]
         zone_id = sensor_data[CONF_SENSOR_ZONE_ID]
 
-        description_text = f"Sensor {self._current_sensor_index + 1} of {len(self._sensor_keys)}\n"
-        description_text += f"Topic: {sensor_data['topic']}\n"
-        description_text += f"Type: {sensor_type}"
-
         schema_dict = {
             vol.Required(CONF_SENSOR_ENABLED, default=sensor_data.get(CONF_SENSOR_ENABLED, True)): bool,
             vol.Required(CONF_SENSOR_NAME, default=sensor_data.get(CONF_SENSOR_NAME, "")): str,
@@ -421,11 +507,11 @@ class SelfMonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=vol.Schema(schema_dict),
             description_placeholders={
                 "sensor_id": f"{sensor_type} - {zone_id}",
-                "sensor_num": str(self._current_sensor_index + 1),
-                "total_sensors": str(len(self._sensor_keys)),
+                "sensor_num": str(index + 1),
+                "total_sensors": str(self._total),
                 "topic": sensor_data["topic"],
             },
-            last_step=(self._current_sensor_index == len(self._sensor_keys) - 1),
+            last_step=(index == self._total - 1),
         )
 
     @staticmethod
@@ -443,7 +529,7 @@ class SelfMonOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
-        self._sensors = dict(config_entry.data.get(CONF_SENSORS, {}))
+        self._sensors: dict[str, dict[str, Any]] = {}
         self._sensor_keys: list[str] = []
         self._current_sensor_index: int = 0
 
@@ -452,6 +538,10 @@ class SelfMonOptionsFlow(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Manage the options."""
         if user_input is not None:
+            # Deep copy only on the write path so edits never alias entry.data
+            self._sensors = copy.deepcopy(
+                self._config_entry.data.get(CONF_SENSORS, {})
+            )
             self._sensor_keys = [
                 key for key, data in sorted(self._sensors.items())
                 if not data.get("auto_enabled", False)
@@ -482,8 +572,7 @@ class SelfMonOptionsFlow(config_entries.OptionsFlow):
             self._current_sensor_index += 1
 
             if self._current_sensor_index >= len(self._sensor_keys):
-                new_data = dict(self._config_entry.data)
-                new_data[CONF_SENSORS] = self._sensors
+                new_data = {**self._config_entry.data, CONF_SENSORS: self._sensors}
                 self.hass.config_entries.async_update_entry(
                     self._config_entry, data=new_data
                 )
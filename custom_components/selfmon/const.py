@@ -1,6 +1,8 @@
 """Constants for the SelfMon (Honeywell Galaxy Alarm) integration."""
 from __future__ import annotations
 
+import sys
+
 DOMAIN = "selfmon"
 MANUFACTURER = "SelfMon"
 
@@ -31,11 +33,11 @@ TOPIC_VKP_LINE1 = "vkp/display/line1"
 TOPIC_VKP_LINE2 = "vkp/display/line2"
 TOPIC_VERSION = "version"
 
-# Payloads
-PAYLOAD_OPEN = "OPEN"
-PAYLOAD_CLOSED = "CLOSED"
-PAYLOAD_ON = "ON"
-PAYLOAD_OFF = "OFF"
+# Payloads (interned so per-message dict lookups hit the identity fast path)
+PAYLOAD_OPEN = sys.intern("OPEN")
+PAYLOAD_CLOSED = sys.intern("CLOSED")
+PAYLOAD_ON = sys.intern("ON")
+PAYLOAD_OFF = sys.intern("OFF")
 
 # Device classes for binary sensors
 DEVICE_CLASS_OPTIONS = [
@@ -54,3 +56,5 @@ DEVICE_CLASS_OPTIONS = [
 # Discovery timeout in seconds
 DISCOVERY_TIMEOUT = 10
 MODULE_DISCOVERY_TIMEOUT = 8
+# End discovery early once no new message has arrived for this long
+DISCOVERY_QUIESCE_TIMEOUT = 0.5
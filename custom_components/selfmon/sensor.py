@@ -1,10 +1,11 @@
 """Sensor platform for SelfMon (Honeywell Galaxy Alarm) integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from functools import cached_property, partial
+from typing import Any, Callable
 
-from homeassistant.components import mqtt
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -13,9 +14,11 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import async_prime_subscriptions, async_subscribe_shared
 from .const import (
     CONF_MODULE_PATH,
     CONF_SENSORS,
@@ -34,6 +37,60 @@ from .const import (
 )
 
 _LOGGER = logging.getLogger(__name__)
+# Pre-bound for the per-message error path
+_warn = _LOGGER.warning
+
+# Entities registered per async_add_entities call on large configs
+_ADD_ENTITIES_CHUNK = 50
+
+# Raw-payload forms for sensors subscribed with encoding=None
+_OUTPUT_PAYLOAD_MAP = {
+    PAYLOAD_ON.encode(): PAYLOAD_ON,
+    PAYLOAD_OFF.encode(): PAYLOAD_OFF,
+}
+
+
+# Message handlers shared per sensor type; subscribed as
+# functools.partial(handler, entity) so no per-entity function objects or
+# closure cells are created
+@callback
+def _handle_output(entity: SelfMonOutputSensor, msg) -> None:
+    """Handle a new MQTT message for an output sensor."""
+    payload = _OUTPUT_PAYLOAD_MAP.get(msg.payload)
+    if payload is None:
+        payload = msg.payload.decode("utf-8", "replace")
+    if payload == entity._attr_native_value:
+        return
+    entity._attr_native_value = payload
+    entity._schedule_write()
+
+
+@callback
+def _handle_temperature(entity: SelfMonTemperatureSensor, msg) -> None:
+    """Handle a new MQTT message for a temperature sensor."""
+    raw = msg.payload
+    if raw == entity._raw_payload:
+        return
+    entity._raw_payload = raw
+    try:
+        value = float(raw)
+    except ValueError:
+        _warn("Invalid temperature value: %s", raw)
+        return
+    if value == entity._attr_native_value:
+        return
+    entity._attr_native_value = value
+    entity._schedule_write()
+
+
+@callback
+def _handle_text(entity: SelfMonBaseSensor, msg) -> None:
+    """Handle a new MQTT message for a plain text sensor."""
+    payload = msg.payload
+    if payload == entity._attr_native_value:
+        return
+    entity._attr_native_value = payload
+    entity._schedule_write()
 
 
 async def async_setup_entry(
@@ -42,64 +99,77 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up SelfMon sensors from a config entry."""
-    data = hass.data[DOMAIN][config_entry.entry_id]
+    entry_id = config_entry.entry_id
+    data = hass.data[DOMAIN][entry_id]
     module_path = data[CONF_MODULE_PATH]
-    sensors_config = data.get(CONF_SENSORS, {})
-
-    entities = []
-
-    for sensor_key, sensor_data in sensors_config.items():
-        if not sensor_data.get(CONF_SENSOR_ENABLED, True):
-            continue
-
-        sensor_type = sensor_data.get(CONF_SENSOR_TYPE)
-
-        if sensor_type == SENSOR_TYPE_OUTPUT:
-            entities.append(
-                SelfMonOutputSensor(
-                    module_path=module_path,
-                    sensor_key=sensor_key,
-                    sensor_config=sensor_data,
-                    entry_id=config_entry.entry_id,
-                )
-            )
-        elif sensor_type == SENSOR_TYPE_TEMPERATURE:
-            entities.append(
-                SelfMonTemperatureSensor(
-                    module_path=module_path,
-                    sensor_key=sensor_key,
-                    sensor_config=sensor_data,
-                    entry_id=config_entry.entry_id,
-                )
-            )
-        elif sensor_type == SENSOR_TYPE_VKP_LINE:
-            entities.append(
-                SelfMonVKPSensor(
-                    module_path=module_path,
-                    sensor_key=sensor_key,
-                    sensor_config=sensor_data,
-                    entry_id=config_entry.entry_id,
-                )
-            )
-        elif sensor_type == SENSOR_TYPE_VERSION:
-            entities.append(
-                SelfMonVersionSensor(
-                    module_path=module_path,
-                    sensor_key=sensor_key,
-                    sensor_config=sensor_data,
-                    entry_id=config_entry.entry_id,
-                )
-            )
-
-    async_add_entities(entities)
+    sensors_config = data.get(CONF_SENSORS) or {}
+
+    entities = [
+        _SENSOR_CLASSES[sensor_type](
+            module_path=module_path,
+            sensor_key=sensor_key,
+            sensor_config=sensor_data,
+            entry_id=entry_id,
+        )
+        for sensor_key, sensor_data in sensors_config.items()
+        if sensor_data.get(CONF_SENSOR_ENABLED, True)
+        and (sensor_type := sensor_data.get(CONF_SENSOR_TYPE)) in _SENSOR_CLASSES
+    ]
+
+    # Registry-disabled entities are never added to hass and would leave
+    # their primed subscriptions receiving and dropping messages
+    registry = er.async_get(hass)
+
+    def _registry_enabled(entity: SelfMonBaseSensor) -> bool:
+        entity_id = registry.async_get_entity_id(
+            "sensor", DOMAIN, entity._attr_unique_id
+        )
+        if entity_id is None:
+            return True
+        registry_entry = registry.async_get(entity_id)
+        return registry_entry is None or registry_entry.disabled_by is None
+
+    # Open all broker subscriptions in one batch so the entities attach to
+    # them without awaiting the MQTT client one by one
+    await async_prime_subscriptions(
+        hass,
+        data,
+        (
+            (entity._topic, entity._payload_encoding)
+            for entity in entities
+            if _registry_enabled(entity)
+        ),
+    )
+
+    # Register in chunks, yielding between batches so the event loop can
+    # drain the retained-message backlog instead of stalling on registry work
+    for start in range(0, len(entities), _ADD_ENTITIES_CHUNK):
+        async_add_entities(entities[start : start + _ADD_ENTITIES_CHUNK])
+        await asyncio.sleep(0)
 
 
 class SelfMonBaseSensor(SensorEntity):
     """Base class for SelfMon sensors."""
 
+    __slots__ = (
+        "_module_path",
+        "_sensor_key",
+        "_sensor_config",
+        "_entry_id",
+        "_zone_id",
+        "_topic",
+        "_module_id",
+        "_uid_prefix",
+        "_unsubscribe",
+        "_write_pending",
+    )
+
     _attr_has_entity_name = True
     _attr_should_poll = False
 
+    # Payload decode applied by the MQTT client; None delivers raw bytes
+    _payload_encoding: str | None = "utf-8"
+
     def __init__(
         self,
         module_path: str,
@@ -115,13 +185,17 @@ class SelfMonBaseSensor(SensorEntity):
 
         self._zone_id = sensor_config.get(CONF_SENSOR_ZONE_ID, "")
         self._topic = sensor_config.get("topic", sensor_key)
+        self._module_id = module_path.rsplit(".", 1)[-1]
+        self._uid_prefix = f"selfmon_{self._module_id}_"
+        self._unsubscribe: Callable[[], None] | None = None
+        self._write_pending = False
 
         self._attr_native_value = None
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        module_id = self._module_path.split(".")[-1] if "." in self._module_path else self._module_path
+        module_id = self._module_id
         return DeviceInfo(
             identifiers={(DOMAIN, f"selfmon_{module_id}")},
             name="Honeywell Galaxy Alarm",
@@ -129,15 +203,52 @@ class SelfMonBaseSensor(SensorEntity):
             model=f"VMOD {module_id}",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to MQTT topic when added to hass."""
+        entry_data = self.hass.data[DOMAIN][self._entry_id]
+        self._unsubscribe = await async_subscribe_shared(
+            self.hass,
+            entry_data,
+            self._topic,
+            partial(self._message_handler, self),
+            qos=0,
+            encoding=self._payload_encoding,
+        )
+
+    @callback
+    def _schedule_write(self) -> None:
+        """Schedule a state write, coalescing bursts within one loop tick."""
+        if self._write_pending:
+            return
+        self._write_pending = True
+        self.hass.loop.call_soon(self._flush_write)
+
+    @callback
+    def _flush_write(self) -> None:
+        """Write the latest state for all messages coalesced this tick."""
+        # Cleared on removal so a scheduled flush does not write state for
+        # an entity that is no longer in hass
+        if not self._write_pending:
+            return
+        self._write_pending = False
+        self.async_write_ha_state()
+
     async def async_will_remove_from_hass(self) -> None:
         """Unsubscribe from MQTT topic when removed."""
-        if hasattr(self, "_unsubscribe"):
+        self._write_pending = False
+        if self._unsubscribe is not None:
             self._unsubscribe()
+            self._unsubscribe = None
 
 
 class SelfMonOutputSensor(SelfMonBaseSensor):
     """Representation of a SelfMon output sensor."""
 
+    __slots__ = ()
+
+    _payload_encoding = None
+    _message_handler = staticmethod(_handle_output)
+
     def __init__(
         self,
         module_path: str,
@@ -148,30 +259,18 @@ class SelfMonOutputSensor(SelfMonBaseSensor):
         """Initialize the output sensor."""
         super().__init__(module_path, sensor_key, sensor_config, entry_id)
 
-        module_id = module_path.split(".")[-1] if "." in module_path else module_path
-        self._attr_unique_id = f"selfmon_{module_id}_output_{self._zone_id}"
+        self._attr_unique_id = self._uid_prefix + "output_" + self._zone_id
         self._attr_name = sensor_config.get(CONF_SENSOR_NAME, f"Output {self._zone_id}")
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT topic when added to hass."""
-        @callback
-        def message_received(msg):
-            """Handle new MQTT message."""
-            payload = msg.payload
-            if payload in (PAYLOAD_ON, PAYLOAD_OFF):
-                self._attr_native_value = payload
-            else:
-                self._attr_native_value = payload
-            self.async_write_ha_state()
-
-        self._unsubscribe = await mqtt.async_subscribe(
-            self.hass, self._topic, message_received, qos=0
-        )
-
 
 class SelfMonTemperatureSensor(SelfMonBaseSensor):
     """Representation of a SelfMon temperature sensor."""
 
+    __slots__ = ("_raw_payload",)
+
+    _payload_encoding = None
+    _message_handler = staticmethod(_handle_temperature)
+
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -186,31 +285,18 @@ class SelfMonTemperatureSensor(SelfMonBaseSensor):
         """Initialize the temperature sensor."""
         super().__init__(module_path, sensor_key, sensor_config, entry_id)
 
-        module_id = module_path.split(".")[-1] if "." in module_path else module_path
-        self._attr_unique_id = f"selfmon_{module_id}_temperature"
+        self._attr_unique_id = self._uid_prefix + "temperature"
         self._attr_name = sensor_config.get(CONF_SENSOR_NAME, "Temperature")
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT topic when added to hass."""
-        @callback
-        def message_received(msg):
-            """Handle new MQTT message."""
-            try:
-                self._attr_native_value = float(msg.payload)
-                self.async_write_ha_state()
-            except ValueError:
-                _LOGGER.warning(
-                    "Invalid temperature value: %s", msg.payload
-                )
-
-        self._unsubscribe = await mqtt.async_subscribe(
-            self.hass, self._topic, message_received, qos=0
-        )
+        self._raw_payload = None
 
 
 class SelfMonVKPSensor(SelfMonBaseSensor):
     """Representation of a SelfMon virtual keypad display sensor."""
 
+    __slots__ = ()
+
+    _message_handler = staticmethod(_handle_text)
+
     def __init__(
         self,
         module_path: str,
@@ -221,27 +307,18 @@ class SelfMonVKPSensor(SelfMonBaseSensor):
         """Initialize the VKP sensor."""
         super().__init__(module_path, sensor_key, sensor_config, entry_id)
 
-        module_id = module_path.split(".")[-1] if "." in module_path else module_path
         line_id = self._zone_id
-        self._attr_unique_id = f"selfmon_{module_id}_vkp_{line_id}"
+        self._attr_unique_id = self._uid_prefix + "vkp_" + line_id
         self._attr_name = sensor_config.get(CONF_SENSOR_NAME, f"Keypad {line_id.title()}")
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT topic when added to hass."""
-        @callback
-        def message_received(msg):
-            """Handle new MQTT message."""
-            self._attr_native_value = msg.payload
-            self.async_write_ha_state()
-
-        self._unsubscribe = await mqtt.async_subscribe(
-            self.hass, self._topic, message_received, qos=0
-        )
-
 
 class SelfMonVersionSensor(SelfMonBaseSensor):
     """Representation of a SelfMon version sensor."""
 
+    __slots__ = ()
+
+    _message_handler = staticmethod(_handle_text)
+
     def __init__(
         self,
         module_path: str,
@@ -252,19 +329,15 @@ class SelfMonVersionSensor(SelfMonBaseSensor):
         """Initialize the version sensor."""
         super().__init__(module_path, sensor_key, sensor_config, entry_id)
 
-        module_id = module_path.split(".")[-1] if "." in module_path else module_path
-        self._attr_unique_id = f"selfmon_{module_id}_version"
+        self._attr_unique_id = self._uid_prefix + "version"
         self._attr_name = sensor_config.get(CONF_SENSOR_NAME, "Version")
         self._attr_icon = "mdi:information-outline"
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT topic when added to hass."""
-        @callback
-        def message_received(msg):
-            """Handle new MQTT message."""
-            self._attr_native_value = msg.payload
-            self.async_write_ha_state()
-
-        self._unsubscribe = await mqtt.async_subscribe(
-            self.hass, self._topic, message_received, qos=0
-        )
+
+# Sensor class per configured sensor type, used by async_setup_entry
+_SENSOR_CLASSES = {
+    SENSOR_TYPE_OUTPUT: SelfMonOutputSensor,
+    SENSOR_TYPE_TEMPERATURE: SelfMonTemperatureSensor,
+    SENSOR_TYPE_VKP_LINE: SelfMonVKPSensor,
+    SENSOR_TYPE_VERSION: SelfMonVersionSensor,
+}